@@ -1,24 +1,77 @@
 from tkinter import filedialog, messagebox
+import numpy as np
 import pandas as pd
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 # from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+import glob
+import json
 import os
+import signal
+import subprocess
+import sys
+import threading
 import getpass
 import tkinter as tk
 
+from page_archive import PageArchive, ProfilePageParser, canonical_url
+from title_normalizer import classify_changes
+from report_index import ReportedChangeIndex
+from memory_tracker import MemoryTracker
+from status_server import StatusPublisher
+
 
 class LinkedInValidator:
+    REQUIRED_COLUMNS = [
+        'Company Name', 
+        'First Name', 
+        'Last Name', 
+        'Job Title', 
+        'LinkedIn URL'
+    ]
+
     def __init__(self):
         self.df = None
         self.driver = None
         self.profiles_list = []
         self.updates_list = []
         self.debug_mode = False
+        self.archive = None
+        self.fingerprint_file = None
+        self.recheck_after_days = None
+        self._fingerprints = None
+        self._verified_keys = set()
+        self._fetched = {}
+        self._fetch_uses = Counter()
+        self.controller = None
+        self.progress_file = None
+        self.report_timestamp = None
+        # Wall-clock budget per profile, enforced by a watchdog thread
+        self.profile_timeout = 120
+        self.page_load_timeout = 60
+        self.driver_restart_attempts = 3
+        self._watchdog_fired = False
+        self._extraction_done = False
+        self._watchdog_lock = threading.Lock()
+        self._session_cookies = []
+        self.timed_out_profiles = []
+        self.run_stats = Counter()
+        self.report_index_file = "reported_changes.idx"
+        self.report_index = None
+        self.memory_tracker = None
+        self.memory_interval = 1000
+        self._last_save_snapshot = 0
+        self.failures = Counter()
+        self.status_publisher = None
+        self._status_phase = "starting"
+        self._status_total = 0
         # Initialize root window but keep it hidden
         self.root = tk.Tk()
         self.root.withdraw()
@@ -28,6 +81,62 @@ class LinkedInValidator:
         self.debug_mode = True
         print("Debug mode enabled")
 
+    def enable_archive(self, archive_dir="page_archive"):
+        """Keep a compressed copy of every fetched profile page"""
+        self.archive = PageArchive(archive_dir)
+        print(f"Archiving fetched pages to {archive_dir}")
+
+    def enable_memory_profiling(self, top_n=10, interval=1000):
+        """
+        Trace allocations with tracemalloc and report the top allocating
+        lines after CSV load, after the profile list is built, every
+        `interval` profiles during verification and around save_updates.
+        """
+        self.memory_tracker = MemoryTracker(top_n=top_n)
+        self.memory_interval = interval
+        self.memory_tracker.start()
+        print("Memory profiling enabled")
+
+    def _memory_checkpoint(self, phase):
+        """Take a memory snapshot if profiling is enabled"""
+        if self.memory_tracker:
+            self.memory_tracker.checkpoint(phase)
+
+    def enable_status(self, port=8765, status_file=None, interval=5):
+        """
+        Publish live progress as JSON on http://127.0.0.1:<port>/status
+        and/or in an atomically replaced status file. Pass port=None to
+        only write the file.
+        """
+        self.status_publisher = StatusPublisher(
+            self._status_snapshot, port=port, status_file=status_file, interval=interval
+        )
+
+    def _status_snapshot(self):
+        """Current counters for the status publisher"""
+        processed = self.run_stats['processed']
+        return {
+            'phase': self._status_phase,
+            'total': self._status_total,
+            'processed': processed,
+            'remaining': max(self._status_total - processed, 0),
+            'updates_found': self.run_stats['updates_found'],
+            'failures': dict(self.failures),
+            'timeouts': self.run_stats['timeouts'],
+            'driver_restarts': self.run_stats['driver_restarts']
+        }
+
+    def enable_incremental(self, fingerprint_file="roster_fingerprints.csv", recheck_after_days=None):
+        """
+        Fingerprint roster rows between runs so only new and edited rows
+        are forced into verification. Unchanged rows are re-checked once
+        their last verification is older than recheck_after_days (or on
+        every run when it is None).
+        """
+        self.fingerprint_file = fingerprint_file
+        self.recheck_after_days = recheck_after_days
+        print(f"Incremental mode enabled using {fingerprint_file}")
+
     def validate_csv_file(self):
         """Get and validate CSV file using Tkinter file dialog"""
         while True:
@@ -50,13 +159,7 @@ class LinkedInValidator:
                 df = pd.read_csv(file_path)
                 
                 # Check required columns
-                required_columns = [
-                    'Company Name', 
-                    'First Name', 
-                    'Last Name', 
-                    'Job Title', 
-                    'LinkedIn URL'
-                ]
+                required_columns = self.REQUIRED_COLUMNS
                 
                 missing_columns = [col for col in required_columns if col not in df.columns]
                 
@@ -86,10 +189,169 @@ class LinkedInValidator:
                 messagebox.showerror("Error", f"Error reading CSV file:\n{str(e)}")
                 continue
 
+    def load_roster_batch(self, source):
+        """
+        Load every roster CSV in a directory (or matching a glob pattern)
+        in parallel and merge them into one deduplicated work set.
+        Each profile keeps the list of source files it came from.
+        """
+        if os.path.isdir(source):
+            file_paths = sorted(glob.glob(os.path.join(source, '*.csv')))
+        else:
+            file_paths = sorted(glob.glob(source))
+
+        if not file_paths:
+            print(f"No roster files found for {source}")
+            return False
+
+        # Tag rows by path relative to the files' common directory, so
+        # same-named rosters from different subdirectories stay apart
+        base_dir = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in file_paths])
+        source_names = [os.path.relpath(os.path.abspath(p), base_dir) for p in file_paths]
+
+        with ThreadPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(self.read_roster_file, file_paths, source_names))
+
+        frames = []
+        for file_path, df, error in results:
+            if error:
+                print(f"Skipping {file_path}: {error}")
+                continue
+            frames.append(df)
+
+        if not frames:
+            print("No valid roster files to process.")
+            return False
+
+        combined = pd.concat(frames, ignore_index=True)
+        # Identical rows from several rosters become one profile tagged
+        # with every file it appeared in
+        self.df = (
+            combined.groupby(self.REQUIRED_COLUMNS, sort=False)['Source File']
+            .agg(lambda sources: list(dict.fromkeys(sources)))
+            .reset_index()
+        )
+        self._create_profiles_list()
+        print(f"Loaded {len(combined)} rows from {len(frames)} files "
+              f"({len(self.df)} unique profiles)")
+        return True
+
+    @classmethod
+    def read_roster_file(cls, file_path, source_name=None):
+        """
+        Read and validate one roster file. Returns (path, df, error).
+        Rows are tagged with source_name in a 'Source File' column if given.
+        """
+        try:
+            df = pd.read_csv(file_path)
+        except Exception as e:
+            return file_path, None, f"Error reading CSV file: {str(e)}"
+
+        missing_columns = [col for col in cls.REQUIRED_COLUMNS if col not in df.columns]
+        if missing_columns:
+            return file_path, None, f"Missing required columns: {', '.join(missing_columns)}"
+
+        df = df[cls.REQUIRED_COLUMNS].copy()
+        empty_rows = df.isna().any(axis=1)
+        if empty_rows.any():
+            print(f"Warning: dropping {int(empty_rows.sum())} rows with empty values in {file_path}")
+            df = df[~empty_rows]
+
+        for col in cls.REQUIRED_COLUMNS:
+            df[col] = df[col].astype(str).str.strip()
+        if source_name is not None:
+            df['Source File'] = source_name
+        return file_path, df, None
+
+    def enable_controller(self, controller, progress_file="verification_progress.jsonl"):
+        """
+        Verify profiles in batches handed out by a ScrapingController
+        (see optional/controller.py). Updates and progress are committed
+        after every batch, so a run can pause, stop and resume across
+        sessions without fetching any profile twice.
+        """
+        self.controller = controller
+        self.progress_file = progress_file
+        print(f"Batch verification enabled, progress in {progress_file}")
+
     def _create_profiles_list(self):
         """Create list of profiles from DataFrame"""
-        self.profiles_list = []
-        for _, row in self.df.iterrows():
+        self._memory_checkpoint("after CSV load")
+        if self.fingerprint_file:
+            self._classify_rows()
+        self.profiles_list = self.profiles_from_frame(self.df)
+        self._memory_checkpoint("after profile list creation")
+
+    def _load_fingerprints(self):
+        """Load row fingerprints stored by the previous run"""
+        if not os.path.exists(self.fingerprint_file):
+            return pd.DataFrame({
+                'URL Key': pd.Series(dtype=object),
+                'Row Hash': pd.Series(dtype='uint64'),
+                'Last Verified': pd.Series(dtype=object)
+            })
+        return pd.read_csv(self.fingerprint_file, dtype={'Row Hash': 'uint64', 'Last Verified': object})
+
+    def _classify_rows(self):
+        """Mark each roster row as new, edited or unchanged since the last run"""
+        previous = self._load_fingerprints()
+
+        required = self.df[self.REQUIRED_COLUMNS].astype(str).apply(lambda col: col.str.strip())
+        url_keys = required['LinkedIn URL'].map(self._canonical_url)
+        row_hashes = pd.util.hash_pandas_object(required, index=False).to_numpy()
+
+        known = url_keys.isin(previous['URL Key']).to_numpy()
+        same = pd.MultiIndex.from_arrays([url_keys, row_hashes]).isin(
+            pd.MultiIndex.from_arrays([previous['URL Key'], previous['Row Hash'].to_numpy()])
+        )
+        status = np.select([~known, ~same], ['new', 'edited'], default='unchanged')
+
+        # Verification dates are kept per URL, across all of its rows
+        last_verified = url_keys.map(previous.groupby('URL Key')['Last Verified'].max())
+        due = (status != 'unchanged') | last_verified.isna().to_numpy()
+        if self.recheck_after_days is None:
+            due[:] = True
+        else:
+            cutoff = (datetime.now() - timedelta(days=self.recheck_after_days)).strftime('%Y-%m-%d')
+            due |= (last_verified.fillna('') < cutoff).to_numpy()
+
+        self.df['Row Status'] = status
+        self.df['Verify'] = due
+        self._fingerprints = pd.DataFrame({
+            'URL Key': url_keys.to_numpy(),
+            'Row Hash': row_hashes,
+            'Last Verified': last_verified.astype(object).to_numpy()
+        })
+
+        removed = int((~previous['URL Key'].drop_duplicates().isin(url_keys)).sum())
+        counts = pd.Series(status).value_counts()
+        print(f"Roster changes: {counts.get('new', 0)} new, {counts.get('edited', 0)} edited, "
+              f"{counts.get('unchanged', 0)} unchanged, {removed} removed "
+              f"({int(due.sum())} rows to verify)")
+
+    def _save_fingerprints(self):
+        """Store row fingerprints and verification dates for the next run"""
+        if self._fingerprints is None:
+            return
+        try:
+            state = self._fingerprints.copy()
+            verified = state['URL Key'].isin(self._verified_keys)
+            state.loc[verified, 'Last Verified'] = datetime.now().strftime('%Y-%m-%d')
+            # A URL can appear on several rows (e.g. rosters that disagree
+            # about a person), so every distinct row hash is kept
+            state = state.drop_duplicates(['URL Key', 'Row Hash'])
+
+            tmp_file = f"{self.fingerprint_file}.tmp"
+            state.to_csv(tmp_file, index=False)
+            os.replace(tmp_file, self.fingerprint_file)
+        except Exception as e:
+            print(f"Error saving row fingerprints: {str(e)}")
+
+    @staticmethod
+    def profiles_from_frame(df):
+        """Build profile dicts from a roster DataFrame"""
+        profiles = []
+        for _, row in df.iterrows():
             profile = {
                 'first_name': row['First Name'].strip(),
                 'last_name': row['Last Name'].strip(),
@@ -97,7 +359,13 @@ class LinkedInValidator:
                 'job_title': row['Job Title'].strip(),
                 'linkedin_url': row['LinkedIn URL'].strip()
             }
-            self.profiles_list.append(profile)
+            if 'Source File' in df.columns:
+                profile['source_files'] = row['Source File']
+            if 'Row Status' in df.columns:
+                profile['row_status'] = row['Row Status']
+                profile['verify'] = bool(row['Verify'])
+            profiles.append(profile)
+        return profiles
 
     def get_linkedin_credentials(self):
         """Get LinkedIn credentials from user"""
@@ -123,12 +391,38 @@ class LinkedInValidator:
             options.add_argument('--start-maximized')
             options.add_argument('--disable-notifications')
             
-            self.driver = webdriver.Chrome(options=options)
+            # Run chromedriver in its own process group so a hung driver
+            # can be killed together with the browser it launched
+            popen_kw = {} if sys.platform == 'win32' else {'start_new_session': True}
+            self.driver = webdriver.Chrome(options=options, service=Service(popen_kw=popen_kw))
+            self.driver.set_page_load_timeout(self.page_load_timeout)
             return True
         except Exception as e:
             print(f"Error setting up WebDriver: {str(e)}")
             return False
 
+    def _restart_driver(self):
+        """Replace a hung or killed WebDriver and restore the login session"""
+        print("Restarting WebDriver...")
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+
+        if not self.setup_driver():
+            raise RuntimeError("Could not restart WebDriver")
+
+        # Reuse the session cookies instead of logging in again
+        self.driver.get('https://www.linkedin.com')
+        for cookie in self._session_cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception:
+                continue
+        self.driver.refresh()
+        self.run_stats['driver_restarts'] += 1
+
     def login_to_linkedin(self, email, password):
         """Login to LinkedIn"""
         try:
@@ -157,6 +451,7 @@ class LinkedInValidator:
                 return False
 
             print("Successfully logged in to LinkedIn")
+            self._session_cookies = self.driver.get_cookies()
             return True
             
         except Exception as e:
@@ -164,6 +459,94 @@ class LinkedInValidator:
             return False
 
     def extract_profile_info(self, url):
+        """
+        Extract profile information from LinkedIn page, giving up after
+        profile_timeout seconds. A hung browser is killed and restarted.
+        """
+        if self.driver is None and not self._recover_driver():
+            # An earlier restart failed and the browser is still unavailable
+            self.failures['WebDriverUnavailable'] += 1
+            return None
+
+        info, fired = self._with_watchdog(self._extract_profile_info, url)
+        if fired:
+            print(f"Timed out after {self.profile_timeout}s on {url}")
+            self.run_stats['timeouts'] += 1
+            self.failures['WatchdogTimeout'] += 1
+            self.timed_out_profiles.append(url)
+            self._recover_driver()
+            return None
+        return info
+
+    def _with_watchdog(self, func, *args):
+        """
+        Call func under the profile_timeout watchdog.
+        Returns (result, fired); result is None when the watchdog fired.
+        """
+        self._watchdog_fired = False
+        self._extraction_done = False
+        watchdog = threading.Timer(self.profile_timeout, self._on_watchdog_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            result = func(*args)
+        finally:
+            watchdog.cancel()
+            # Once this is set the watchdog can no longer fire, so a result
+            # that arrives just before the deadline is kept
+            with self._watchdog_lock:
+                self._extraction_done = True
+                fired = self._watchdog_fired
+
+        return (None if fired else result), fired
+
+    def _recover_driver(self):
+        """
+        Restart the WebDriver, retrying up to driver_restart_attempts times.
+        Each attempt is bounded by the watchdog. Returns True once a
+        working driver is back; otherwise self.driver is left as None.
+        """
+        for attempt in range(1, self.driver_restart_attempts + 1):
+            try:
+                _, fired = self._with_watchdog(self._restart_driver)
+                if not fired:
+                    return True
+                error = f"timed out after {self.profile_timeout}s"
+            except Exception as e:
+                # A call aborted by the watchdog's kill fails with a driver error
+                error = f"timed out after {self.profile_timeout}s" if self._watchdog_fired else str(e)
+            self.failures['DriverRestartFailed'] += 1
+            print(f"WebDriver restart attempt {attempt}/{self.driver_restart_attempts} failed: {error}")
+
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+        return False
+
+    def _on_watchdog_timeout(self):
+        """Abort a stuck WebDriver call by killing the driver and its browser"""
+        with self._watchdog_lock:
+            if self._extraction_done:
+                return
+            self._watchdog_fired = True
+        try:
+            self._kill_process_tree(self.driver.service.process.pid)
+        except Exception as e:
+            print(f"Error stopping hung WebDriver: {str(e)}")
+
+    @staticmethod
+    def _kill_process_tree(pid):
+        """Kill a process together with every process it started"""
+        if sys.platform == 'win32':
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            # chromedriver leads its own process group (see setup_driver)
+            os.killpg(pid, signal.SIGKILL)
+
+    def _extract_profile_info(self, url):
         """Extract profile information from LinkedIn page"""
         try:
             self.driver.get(url)
@@ -174,6 +557,9 @@ class LinkedInValidator:
                 EC.presence_of_element_located((By.CSS_SELECTOR, 'div.mt2.relative'))
             )
 
+            if self.archive:
+                self.archive.store(url, self.driver.page_source)
+
             # Extract name
             name_element = self.driver.find_element(
                 By.CSS_SELECTOR, 
@@ -199,17 +585,46 @@ class LinkedInValidator:
             }
 
         except Exception as e:
+            # A watchdog stall is counted once, as WatchdogTimeout
+            if not self._watchdog_fired:
+                self.failures[type(e).__name__] += 1
             print(f"Error extracting profile info for {url}: {str(e)}")
             return None
 
-    def _split_name(self, full_name):
+    @staticmethod
+    def extract_profile_from_html(html, url):
+        """Extract profile information from saved page HTML"""
+        fields = ProfilePageParser.parse(html)
+        # Match the live scraper, which fails when any of these is missing
+        if not (fields.get('profile_section') and fields.get('name') and 'headline' in fields):
+            return None
+
+        first_name, last_name = LinkedInValidator._split_name(fields['name'])
+        job_title, company_name = LinkedInValidator._parse_headline(fields['headline'])
+
+        return {
+            'first_name': first_name,
+            'last_name': last_name,
+            'job_title': job_title,
+            'company_name': company_name,
+            'linkedin_url': url
+        }
+
+    @staticmethod
+    def _canonical_url(url):
+        """Normalize a profile URL so different spellings of it compare equal"""
+        return canonical_url(url)
+
+    @staticmethod
+    def _split_name(full_name):
         """Split full name into first and last name"""
         parts = full_name.split()
         if len(parts) >= 2:
             return parts[0], parts[-1]
         return parts[0], ""
 
-    def _parse_headline(self, headline):
+    @staticmethod
+    def _parse_headline(headline):
         """Parse job title and company from headline"""
         separators = [' at ', ' @ ', ' - ', ' in ', ' with ']
         
@@ -221,82 +636,352 @@ class LinkedInValidator:
         return headline, ""
 
     def verify_profiles(self):
-        """Verify all profiles against LinkedIn"""
+        """
+        Verify all profiles against LinkedIn. Returns False if a batched
+        run's session ended with profiles left to verify.
+        """
         print("\nStarting profile verification...")
         
-        for profile in self.profiles_list:
-            if self.debug_mode:
-                print(f"\nVerifying profile: {profile['first_name']} {profile['last_name']}")
-                
-            current_info = self.extract_profile_info(profile['linkedin_url'])
+        pending = [p for p in self.profiles_list if p.get('verify', True)]
+        if self.controller:
+            pending = self._skip_committed(pending)
+
+        # Profiles shared by several rosters are only fetched once; a fetched
+        # result is kept only until its last profile has been checked
+        self._fetched = {}
+        self._fetch_uses = Counter(self._canonical_url(p['linkedin_url']) for p in pending)
+
+        self._status_total = len(pending)
+        self._status_phase = "verifying"
+        if self.status_publisher:
+            self.status_publisher.start()
+
+        try:
+            if self.controller:
+                completed = self._verify_in_batches(pending)
+            else:
+                for profile in pending:
+                    self._verify_profile(profile)
+                completed = True
+        finally:
+            self._status_phase = "finished"
+            if self.status_publisher:
+                self.status_publisher.stop()
+
+        if completed and self.fingerprint_file:
+            self._save_fingerprints()
+        return completed
+
+    def _verify_profile(self, profile):
+        """Verify a single profile and record an update if it changed"""
+        if self.debug_mode:
+            print(f"\nVerifying profile: {profile['first_name']} {profile['last_name']}")
             
-            if current_info:
-                # Check for changes
-                if (current_info['company_name'].lower() != profile['company_name'].lower() or
-                    current_info['job_title'].lower() != profile['job_title'].lower()):
-                    
-                    update = {
-                        'original': profile,
-                        'current': current_info,
-                        'update_date': datetime.now().strftime('%Y-%m-%d')
-                    }
-                    self.updates_list.append(update)
-                    
-                    if self.debug_mode:
-                        print("Update found!")
-                        print(f"Old: {profile['company_name']} - {profile['job_title']}")
-                        print(f"New: {current_info['company_name']} - {current_info['job_title']}")
+        url_key = self._canonical_url(profile['linkedin_url'])
+        if url_key not in self._fetched:
+            self._fetched[url_key] = self.extract_profile_info(profile['linkedin_url'])
+            if self._fetched[url_key]:
+                self._verified_keys.add(url_key)
+        current_info = self._fetched[url_key]
+
+        self._fetch_uses[url_key] -= 1
+        if self._fetch_uses[url_key] <= 0:
+            del self._fetched[url_key]
+        
+        if current_info:
+            # Check for changes
+            if self.has_changed(profile, current_info):
+                
+                update = {
+                    'original': profile,
+                    'current': current_info,
+                    'update_date': datetime.now().strftime('%Y-%m-%d')
+                }
+                self.updates_list.append(update)
+                self.run_stats['updates_found'] += 1
+                
+                if self.debug_mode:
+                    print("Update found!")
+                    print(f"Old: {profile['company_name']} - {profile['job_title']}")
+                    print(f"New: {current_info['company_name']} - {current_info['job_title']}")
+
+        self.run_stats['processed'] += 1
+        if self.memory_tracker and self.run_stats['processed'] % self.memory_interval == 0:
+            self._memory_checkpoint(f"verification, {self.run_stats['processed']} profiles")
+
+    def _verify_in_batches(self, pending):
+        """
+        Verify profiles in batches sized by the scraping controller,
+        committing updates and progress at every batch boundary.
+        Returns True once every pending profile has been verified.
+        """
+        if not self.controller.should_continue():
+            session = self.controller.start_session()
+            print(f"Starting scraping session until {session['planned_end']}")
+
+        position = 0
+        while position < len(pending) and self.controller.should_continue():
+            action = self.controller.get_next_action()
+
+            if action["action"] == "stop":
+                break
+
+            if action["action"] == "wait":
+                wake_time = min(action["next_check"], self.controller.end_time)
+                print(f"Paused until {wake_time}")
+                self._status_phase = f"paused until {wake_time.isoformat(timespec='seconds')}"
+                time.sleep(max(0, (wake_time - datetime.now()).total_seconds()))
+                self._status_phase = "verifying"
+                continue
+
+            batch = pending[position:position + action["items"]]
+            for profile in batch:
+                self._verify_profile(profile)
+            position += len(batch)
+            self._commit_batch(batch)
+
+            if position < len(pending):
+                self.controller.pause_scraping()
 
-    def save_updates(self):
-        """Save updates to CSV file"""
+        if position < len(pending):
+            print(f"Session ended with {len(pending) - position} profiles remaining; "
+                  f"progress saved to {self.progress_file}")
+            return False
+
+        self.controller.stop_session()
+        if os.path.exists(self.progress_file):
+            os.remove(self.progress_file)
+        return True
+
+    def _skip_committed(self, pending):
+        """Drop profiles already committed by an earlier session"""
+        done = self._load_progress()
+        if not done:
+            return pending
+        remaining = [p for p in pending if self._profile_key(p) not in done]
+        print(f"Resuming: {len(pending) - len(remaining)} profiles already verified, "
+              f"{len(remaining)} remaining")
+        return remaining
+
+    def _profile_key(self, profile):
+        """Identify a roster row across sessions"""
+        return "|".join([
+            self._canonical_url(profile['linkedin_url']),
+            profile['company_name'].lower(),
+            profile['job_title'].lower()
+        ])
+
+    def _load_progress(self):
+        """
+        Load keys of profiles committed by earlier sessions of this run,
+        and restore which URLs those sessions verified successfully
+        """
+        done = set()
+        if not os.path.exists(self.progress_file):
+            return done
+        with open(self.progress_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a partial last line; that batch is redone
+                    continue
+                self.report_timestamp = self.report_timestamp or entry['report_timestamp']
+                done.update(entry['profiles'])
+                self._verified_keys.update(entry.get('verified', []))
+        return done
+
+    def _commit_batch(self, batch):
+        """Durably save a finished batch's updates, then mark its profiles done"""
+        if not self.save_updates(append=True):
+            # Leave the batch uncommitted so a resumed run verifies it again
+            raise RuntimeError("Could not save updates; batch not committed")
+        self.updates_list = []
+
+        entry = {
+            'report_timestamp': self._get_report_timestamp(),
+            'committed_at': datetime.now().isoformat(timespec='seconds'),
+            'profiles': [self._profile_key(p) for p in batch],
+            # Kept so the run's last session can record every verification date
+            'verified': sorted({
+                self._canonical_url(p['linkedin_url']) for p in batch
+            } & self._verified_keys)
+        }
+        with open(self.progress_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def has_changed(profile, current_info):
+        """Check whether company or job title differs from the roster"""
+        return (current_info['company_name'].lower() != profile['company_name'].lower() or
+                current_info['job_title'].lower() != profile['job_title'].lower())
+
+    @staticmethod
+    def build_updates_frame(updates_list):
+        """Build the updates report DataFrame"""
+        updates_data = []
+        for update in updates_list:
+            updates_data.append({
+                'First Name': update['current']['first_name'],
+                'Last Name': update['current']['last_name'],
+                'Original Company': update['original']['company_name'],
+                'Original Job Title': update['original']['job_title'],
+                'New Company': update['current']['company_name'],
+                'New Job Title': update['current']['job_title'],
+                'LinkedIn URL': update['current']['linkedin_url'],
+                'Update Date': update['update_date']
+            })
+        updates_df = pd.DataFrame(updates_data)
+        if not updates_df.empty:
+            updates_df['Change Type'] = classify_changes(updates_df)
+        return updates_df
+
+    def _get_report_timestamp(self):
+        """Timestamp shared by every report file written in this run"""
+        if not self.report_timestamp:
+            self.report_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return self.report_timestamp
+
+    @staticmethod
+    def _write_report(updates_df, output_file, append=False):
+        """Write (or append to) a report file and flush it to disk"""
+        exists = append and os.path.exists(output_file)
+        with open(output_file, 'a' if exists else 'w', newline='', encoding='utf-8') as f:
+            updates_df.to_csv(f, index=False, header=not exists)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _get_report_index(self):
+        """Load the index of previously reported changes on first use"""
+        if self.report_index is None:
+            self.report_index = ReportedChangeIndex(self.report_index_file)
+        return self.report_index
+
+    def _report_key(self, update):
+        """Index key of an update: canonical URL, new company and new title"""
+        return ReportedChangeIndex.make_key(
+            self._canonical_url(update['current']['linkedin_url']),
+            update['current']['company_name'],
+            update['current']['job_title']
+        )
+
+    def save_updates(self, append=False, include_reported=False):
+        """
+        Save updates to CSV file. With append=True, rows are added to the
+        report files already started by this run. Changes already written
+        by an earlier report are skipped unless include_reported is True.
+        """
+        # Batched runs save after every batch, so there memory is only
+        # snapshotted once per memory_interval profiles
+        snapshot = self.memory_tracker and (
+            not append or
+            self.run_stats['processed'] - self._last_save_snapshot >= self.memory_interval
+        )
+        if snapshot:
+            self._last_save_snapshot = self.run_stats['processed']
+            self._memory_checkpoint("before save_updates")
+
+        saved = self._save_updates(append, include_reported)
+
+        if snapshot:
+            self._memory_checkpoint("after save_updates")
+        return saved
+
+    def _save_updates(self, append, include_reported):
+        """Write the updates report; see save_updates"""
         if not self.updates_list:
-            print("\nNo updates found to save.")
+            if not append:
+                print("\nNo updates found to save.")
             return True
 
         try:
-            updates_data = []
-            for update in self.updates_list:
-                updates_data.append({
-                    'First Name': update['current']['first_name'],
-                    'Last Name': update['current']['last_name'],
-                    'Original Company': update['original']['company_name'],
-                    'Original Job Title': update['original']['job_title'],
-                    'New Company': update['current']['company_name'],
-                    'New Job Title': update['current']['job_title'],
-                    'LinkedIn URL': update['current']['linkedin_url'],
-                    'Update Date': update['update_date']
-                })
-
-            updates_df = pd.DataFrame(updates_data)
+            index = self._get_report_index()
+            keys = [self._report_key(update) for update in self.updates_list]
+            if include_reported:
+                updates = self.updates_list
+            else:
+                updates = [u for u, key in zip(self.updates_list, keys) if key not in index]
+                suppressed = len(self.updates_list) - len(updates)
+                self.run_stats['suppressed_updates'] += suppressed
+                if suppressed and self.debug_mode:
+                    print(f"Skipped {suppressed} updates already reported")
+                if not updates:
+                    if not append:
+                        print(f"\nNo new updates to save ({suppressed} already reported).")
+                    return True
+
+            updates_df = self.build_updates_frame(updates)
             
             # Create filename with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_file = f'linkedin_updates_{timestamp}.csv'
-            
-            updates_df.to_csv(output_file, index=False)
-            print(f"\nSaved {len(updates_data)} updates to {output_file}")
+            timestamp = self._get_report_timestamp()
+
+            if 'source_files' in updates[0]['original']:
+                # Batch mode: split the report back out per roster file
+                updates_df['Source File'] = [
+                    update['original']['source_files'] for update in updates
+                ]
+                updates_df = updates_df.explode('Source File')
+                for source_file, source_df in updates_df.groupby('Source File', sort=False):
+                    stem = os.path.splitext(source_file)[0].replace(os.sep, '_').replace('/', '_')
+                    output_file = f'linkedin_updates_{stem}_{timestamp}.csv'
+                    self._write_report(source_df.drop(columns='Source File'), output_file, append)
+                    print(f"\nSaved {len(source_df)} updates to {output_file}")
+            else:
+                output_file = f'linkedin_updates_{timestamp}.csv'
+                
+                self._write_report(updates_df, output_file, append)
+                print(f"\nSaved {len(updates_df)} updates to {output_file}")
+
+            for key in keys:
+                index.add(key)
+            index.flush()
             return True
             
         except Exception as e:
             print(f"Error saving updates: {str(e)}")
             return False
 
+    def print_run_summary(self):
+        """Print counters for the finished run"""
+        print("\nRun summary")
+        print("-----------")
+        print(f"Profiles verified: {len(self._verified_keys)}")
+        print(f"Timed out profiles: {self.run_stats['timeouts']}")
+        print(f"WebDriver restarts: {self.run_stats['driver_restarts']}")
+        print(f"Already reported (skipped): {self.run_stats['suppressed_updates']}")
+        for failure, count in self.failures.most_common():
+            print(f"Failures ({failure}): {count}")
+        for url in self.timed_out_profiles:
+            print(f"  timed out: {url}")
+        if self.memory_tracker:
+            print(f"Peak traced memory: {self.memory_tracker.peak() / (1024 * 1024):.1f} MB")
+
     def cleanup(self):
         """Clean up resources"""
+        if self.memory_tracker:
+            self.memory_tracker.stop()
         if self.driver:
             self.driver.quit()
         # Destroy the Tkinter root window
         if self.root:
             self.root.destroy()
 
-    def run(self):
-        """Main execution flow"""
+    def run(self, source=None):
+        """
+        Main execution flow. If source is a directory or glob pattern,
+        all matching roster files are processed as one batch.
+        """
         try:
             print("LinkedIn Profile Validator")
             print("-------------------------")
             
-            # Validate CSV file
-            if not self.validate_csv_file():
+            # Validate CSV file(s)
+            if source:
+                if not self.load_roster_batch(source):
+                    return False
+            elif not self.validate_csv_file():
                 return False
                 
             # Get LinkedIn credentials
@@ -312,10 +997,28 @@ class LinkedInValidator:
                 return False
                 
             # Verify profiles
-            self.verify_profiles()
+            try:
+                completed = self.verify_profiles()
+            except Exception:
+                # Keep the updates found so far before the error ends the run
+                # (batched runs have already committed theirs)
+                if not self.controller:
+                    self.save_updates()
+                raise
             
-            # Save updates
-            self.save_updates()
+            # Save updates (batched runs commit them as they go)
+            if not self.controller:
+                self.save_updates()
+
+            self.print_run_summary()
+
+            if not completed:
+                messagebox.showinfo(
+                    "Paused",
+                    "The scraping session ended before every profile was verified.\n"
+                    f"Progress is saved in {self.progress_file}; run again to resume."
+                )
+                return True
             
             messagebox.showinfo("Success", "Profile verification completed successfully!")
             return True
@@ -330,5 +1033,5 @@ class LinkedInValidator:
 # Usage
 if __name__ == "__main__":
     validator = LinkedInValidator()
-    validator.run()
+    validator.run(sys.argv[1] if len(sys.argv) > 1 else None)
     
@@ -0,0 +1,64 @@
+import tracemalloc
+
+
+class MemoryTracker:
+    """
+    tracemalloc-based memory profiling for long runs.
+
+    Each checkpoint prints the top allocations by source line and the
+    biggest growth since the previous checkpoint, and records current
+    and peak traced memory for the run summary.
+    """
+
+    # Allocations made by the profiler itself are not interesting
+    IGNORED_FILES = [tracemalloc.__file__, "<frozen importlib._bootstrap>",
+                     "<frozen importlib._bootstrap_external>", "<unknown>"]
+
+    def __init__(self, top_n=10, frames=1):
+        self.top_n = top_n
+        self.frames = frames
+        self.phases = []
+        self._previous = None
+
+    def start(self):
+        """Start tracing allocations"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def stop(self):
+        """Stop tracing and drop the stored snapshot"""
+        self._previous = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def checkpoint(self, phase):
+        """Snapshot memory for a pipeline phase and print its top allocations"""
+        if not tracemalloc.is_tracing():
+            return
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, filename) for filename in self.IGNORED_FILES
+        ])
+        current, peak = tracemalloc.get_traced_memory()
+        self.phases.append({'phase': phase, 'current': current, 'peak': peak})
+
+        print(f"\n[memory] {phase}: current {self._mb(current)}, peak {self._mb(peak)}")
+        print(f"[memory] Top {self.top_n} allocations by line:")
+        for stat in snapshot.statistics('lineno')[:self.top_n]:
+            print(f"  {stat}")
+
+        if self._previous is not None:
+            print("[memory] Largest changes since previous checkpoint:")
+            for stat in snapshot.compare_to(self._previous, 'lineno')[:self.top_n]:
+                print(f"  {stat}")
+
+        # Only the last snapshot is kept so profiling itself stays bounded
+        self._previous = snapshot
+
+    def peak(self):
+        """Peak traced memory in bytes since tracing started"""
+        return tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+
+    @staticmethod
+    def _mb(size):
+        return f"{size / (1024 * 1024):.1f} MB"
@@ -1,8 +1,9 @@
 import random
 import time
 from datetime import datetime, timedelta
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from enum import Enum
+from dataclasses import dataclass, field
 import json
 import os
 from pathlib import Path
@@ -17,6 +18,104 @@ class ScrapingSignal(Enum):
     PAUSE = "pause"
     STOP = "stop"
 
+@dataclass
+class SessionPlan:
+    """Precomputed schedule for one scraping session"""
+    seed: int
+    duration_hours: int
+    batch_sizes: List[int] = field(default_factory=list)
+    pause_seconds: List[int] = field(default_factory=list)  # pause after each batch but the last
+
+    @property
+    def total_items(self) -> int:
+        return sum(self.batch_sizes)
+
+    def schedule(self, start_time: datetime, seconds_per_item: float = 0) -> List[dict]:
+        """Expected start time and size of each batch for a session starting at start_time"""
+        batches = []
+        current = start_time
+        for index, items in enumerate(self.batch_sizes):
+            batches.append({"batch": index, "starts_at": current, "items": items})
+            current += timedelta(seconds=items * seconds_per_item)
+            if index < len(self.pause_seconds):
+                current += timedelta(seconds=self.pause_seconds[index])
+        return batches
+
+    def to_dict(self) -> dict:
+        return {
+            "seed": self.seed,
+            "duration_hours": self.duration_hours,
+            "batch_sizes": list(self.batch_sizes),
+            "pause_seconds": list(self.pause_seconds),
+            "total_items": self.total_items
+        }
+
+class SessionPlanner:
+    """
+    Builds reproducible session plans. Every random draw comes from a
+    private generator, so the same seed always yields the same batch
+    sizes, pauses and session length.
+    """
+    def __init__(
+        self,
+        initial_range: Tuple[int, int] = (10, 20),
+        second_range: Tuple[int, int] = (20, 50),
+        sleep_range: Tuple[int, int] = (30, 120),  # minutes
+        max_duration: Tuple[int, int] = (8, 10),   # hours
+        seed: Optional[int] = None,
+        seconds_per_item: float = 0,               # expected scrape time per item
+        max_batches: int = 1000
+    ):
+        self.initial_range = initial_range
+        self.second_range = second_range
+        self.sleep_range = sleep_range
+        self.max_duration = max_duration
+        self.seconds_per_item = seconds_per_item
+        self.max_batches = max_batches
+        # Session seeds are drawn from a seeded sequence so consecutive
+        # sessions differ but the whole series is reproducible
+        self._seeds = random.Random(seed) if seed is not None else random.SystemRandom()
+        self.sessions_planned = 0
+
+    def next_seed(self) -> int:
+        """Draw the seed for the next session"""
+        self.sessions_planned += 1
+        return self._seeds.randrange(2 ** 32)
+
+    def skip_to(self, sessions_planned: int) -> None:
+        """Advance the seed sequence past sessions planned by earlier processes"""
+        while self.sessions_planned < sessions_planned:
+            self.next_seed()
+
+    def plan(self, seed: Optional[int] = None) -> SessionPlan:
+        """Precompute a full session schedule from a seed"""
+        if seed is None:
+            seed = self.next_seed()
+        rng = random.Random(seed)
+
+        duration_hours = rng.randint(self.max_duration[0], self.max_duration[1])
+        plan = SessionPlan(seed=seed, duration_hours=duration_hours)
+
+        budget = duration_hours * 3600
+        elapsed = 0
+        while len(plan.batch_sizes) < self.max_batches:
+            range_to_use = self.initial_range if rng.choice([True, False]) else self.second_range
+            items = rng.randint(range_to_use[0], range_to_use[1])
+            elapsed += items * self.seconds_per_item
+            if elapsed > budget and plan.batch_sizes:
+                break
+            plan.batch_sizes.append(items)
+
+            pause = rng.randint(self.sleep_range[0] * 60, self.sleep_range[1] * 60)
+            if elapsed + pause >= budget:
+                break
+            plan.pause_seconds.append(pause)
+            elapsed += pause
+
+        # The final batch ends the session, so it never has a pause after it
+        del plan.pause_seconds[len(plan.batch_sizes) - 1:]
+        return plan
+
 class ScrapingController:
     def __init__(
         self,
@@ -24,37 +123,95 @@ class ScrapingController:
         initial_range: Tuple[int, int] = (10, 20),
         second_range: Tuple[int, int] = (20, 50),
         sleep_range: Tuple[int, int] = (30, 120),  # minutes
-        max_duration: Tuple[int, int] = (8, 10)    # hours
+        max_duration: Tuple[int, int] = (8, 10),   # hours
+        seed: Optional[int] = None,
+        seconds_per_item: float = 0
     ):
         self.state_file = Path(state_file)
         self.initial_range = initial_range
         self.second_range = second_range
         self.sleep_range = sleep_range
         self.max_duration = max_duration
+        self.planner = SessionPlanner(
+            initial_range, second_range, sleep_range, max_duration,
+            seed=seed, seconds_per_item=seconds_per_item
+        )
+        self.plan = None
+        self._next_plan = None
+        self._batch_index = 0
         self.start_time = None
         self.end_time = None
         self.state = ScrapingState.STOPPED
+        self._state = None
+        self._persisted_state = None
         self._initialize_state_file()
 
     def _initialize_state_file(self) -> None:
         """Initialize or load the state file"""
-        if not self.state_file.exists():
-            self._save_state({
-                "state": ScrapingState.STOPPED.value,
-                "next_run_time": None,
-                "items_to_scrape": 0,
-                "current_session_end": None
-            })
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, 'r') as f:
+                    self._state = json.load(f)
+                self._persisted_state = dict(self._state)
+                self.planner.skip_to(self._state.get("sessions_planned", 0))
+                if self._state.get("current_session_end"):
+                    if self._state.get("session_seed") is None:
+                        # Written before sessions were planned; the session
+                        # cannot be resumed, so the next one starts fresh
+                        print(f"No session plan in {self.state_file}, starting a new session")
+                        self.stop_session()
+                    else:
+                        # Resume the session started by an earlier process
+                        self.end_time = datetime.fromisoformat(self._state["current_session_end"])
+                        self.plan = self.planner.plan(self._state["session_seed"])
+                        self._batch_index = self._state.get("batch_index", 0)
+                return
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Could not read {self.state_file}, resetting state: {str(e)}")
+
+        self._save_state({
+            "state": ScrapingState.STOPPED.value,
+            "next_run_time": None,
+            "items_to_scrape": 0,
+            "current_session_end": None
+        })
 
     def _save_state(self, state_data: dict) -> None:
-        """Save current state to file"""
-        with open(self.state_file, 'w') as f:
-            json.dump(state_data, f)
+        """
+        Update the in-memory state and persist it. The file is only
+        rewritten when the state actually changes.
+        """
+        self._state = dict(state_data)
+        if self._state != self._persisted_state:
+            self._write_state_file()
+
+    def _write_state_file(self) -> None:
+        """Atomically replace the state file so a crash never leaves partial JSON"""
+        tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(self._state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.state_file)
+
+        # Make the rename itself durable where the platform allows it
+        try:
+            dir_fd = os.open(self.state_file.parent, os.O_RDONLY)
+        except OSError:
+            dir_fd = None
+        if dir_fd is not None:
+            try:
+                os.fsync(dir_fd)
+            except OSError:
+                pass
+            finally:
+                os.close(dir_fd)
+
+        self._persisted_state = dict(self._state)
 
     def _load_state(self) -> dict:
-        """Load current state from file"""
-        with open(self.state_file, 'r') as f:
-            return json.load(f)
+        """Return the current in-memory state"""
+        return dict(self._state)
 
     def get_next_action(self) -> dict:
         """
@@ -85,59 +242,82 @@ class ScrapingController:
                     "message": f"Waiting until {next_run_time}"
                 }
 
-        return {"action": "continue", "message": "Continue current operation"}
+        return {
+            "action": "continue",
+            "items": current_state["items_to_scrape"],
+            "message": "Continue current operation"
+        }
+
+    def _session_fields(self) -> dict:
+        """State fields needed to resume the current session's plan"""
+        return {
+            "current_session_end": self.end_time.isoformat() if self.end_time else None,
+            "session_seed": self.plan.seed if self.plan else None,
+            "batch_index": self._batch_index,
+            "sessions_planned": self.planner.sessions_planned
+        }
 
     def _update_running_state(self) -> None:
-        """Update state to running with new scraping parameters"""
-        is_initial = random.choice([True, False])
-        items_to_scrape = self._get_random_items_count(is_initial)
+        """Update state to running with the current planned batch"""
         self._save_state({
             "state": ScrapingState.RUNNING.value,
-            "items_to_scrape": items_to_scrape,
+            "items_to_scrape": self.plan.batch_sizes[self._batch_index],
             "next_run_time": None,
-            "current_session_end": self.end_time.isoformat() if self.end_time else None
+            **self._session_fields()
         })
 
     def _update_paused_state(self) -> None:
-        """Update state to paused with next run time"""
-        sleep_time = self._get_random_sleep_time()
+        """Update state to paused until the next planned batch"""
+        sleep_time = self.plan.pause_seconds[self._batch_index]
         next_run_time = datetime.now() + timedelta(seconds=sleep_time)
-        items_to_scrape = self._get_random_items_count(random.choice([True, False]))
+        self._batch_index += 1
         
         self._save_state({
             "state": ScrapingState.PAUSED.value,
             "next_run_time": next_run_time.isoformat(),
-            "items_to_scrape": items_to_scrape,
-            "current_session_end": self.end_time.isoformat() if self.end_time else None
+            "items_to_scrape": self.plan.batch_sizes[self._batch_index],
+            **self._session_fields()
         })
 
-    def _get_random_sleep_time(self) -> int:
-        """Returns random sleep time in seconds"""
-        return random.randint(
-            self.sleep_range[0] * 60,
-            self.sleep_range[1] * 60
-        )
+    def plan_session(self) -> dict:
+        """
+        Precompute the next session's plan without starting it, so the
+        expected throughput can be checked up front. start_session uses
+        this same plan.
+        """
+        if self._next_plan is None:
+            self._next_plan = self.planner.plan()
+        return self._describe_plan(self._next_plan, datetime.now())
 
-    def _get_random_items_count(self, is_initial: bool = True) -> int:
-        """Returns random number of items to scrape"""
-        range_to_use = self.initial_range if is_initial else self.second_range
-        return random.randint(range_to_use[0], range_to_use[1])
+    def _describe_plan(self, plan: SessionPlan, start_time: datetime) -> dict:
+        info = plan.to_dict()
+        info["planned_end"] = start_time + timedelta(hours=plan.duration_hours)
+        info["schedule"] = plan.schedule(start_time, self.planner.seconds_per_item)
+        return info
 
     def start_session(self) -> dict:
         """Start a new scraping session"""
+        self.plan = self._next_plan or self.planner.plan()
+        self._next_plan = None
+        self._batch_index = 0
         self.start_time = datetime.now()
-        duration_hours = random.randint(self.max_duration[0], self.max_duration[1])
+        duration_hours = self.plan.duration_hours
         self.end_time = self.start_time + timedelta(hours=duration_hours)
         
         self._update_running_state()
         return {
             "action": "start",
             "planned_end": self.end_time,
-            "duration_hours": duration_hours
+            "duration_hours": duration_hours,
+            "expected_items": self.plan.total_items,
+            "plan": self._describe_plan(self.plan, self.start_time)
         }
 
     def pause_scraping(self) -> dict:
         """Signal to pause scraping and go silent"""
+        if self._batch_index + 1 >= len(self.plan.batch_sizes):
+            # Every planned batch has run
+            return self.stop_session()
         self._update_paused_state()
         current_state = self._load_state()
         return {
@@ -148,11 +328,14 @@ class ScrapingController:
 
     def stop_session(self) -> dict:
         """Signal to stop the scraping session"""
+        self.plan = None
+        self.end_time = None
         self._save_state({
             "state": ScrapingState.STOPPED.value,
             "next_run_time": None,
             "items_to_scrape": 0,
-            "current_session_end": None
+            "current_session_end": None,
+            "sessions_planned": self.planner.sessions_planned
         })
         return {"action": "stop", "message": "Scraping session stopped"}
 
@@ -170,10 +353,13 @@ def example_usage():
         initial_range=(10, 20),
         second_range=(20, 50),
         sleep_range=(30, 120),
-        max_duration=(8, 10)
+        max_duration=(8, 10),
+        seed=42
     )
     
-    # Start the session
+    # Inspect the plan, then start the session
+    plan = controller.plan_session()
+    print(f"Planned {len(plan['batch_sizes'])} batches, {plan['total_items']} items in total")
     session_info = controller.start_session()
     print(f"Starting session until: {session_info['planned_end']}")
     
@@ -187,13 +373,18 @@ def example_usage():
             
         elif action["action"] == "wait":
             print(f"Waiting until {action['next_check']}")
-            time.sleep(60)  # Check every minute
+            # Sleep exactly until the next run is due
+            time.sleep(max(0, (action['next_check'] - datetime.now()).total_seconds()))
             continue
             
-        elif action["action"] == "scrape":
+        elif action["action"] in ("scrape", "continue"):
+            # "continue" is returned while the session's current batch is running
             print(f"Scraping {action['items']} items")
             # Your scraping logic here
             
             # After scraping, pause
             pause_info = controller.pause_scraping()
+            if pause_info["action"] == "stop":
+                print("All planned batches done")
+                break
             print(f"Pausing until {pause_info['next_run_time']}")
@@ -0,0 +1,192 @@
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a profile URL so different spellings of it compare equal"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return f"{host}{parts.path.rstrip('/').lower()}"
+
+
+class PageArchive:
+    """
+    Content-addressed store of fetched profile pages.
+
+    Each page is gzip-compressed and stored once under its SHA-256 digest,
+    so identical re-fetches cost no extra disk. An append-only index maps
+    every URL to the digest of its most recent fetch. URLs are matched by
+    canonical_url, so any spelling of a profile URL finds its page.
+    """
+
+    INDEX_FILE = "index.jsonl"
+    OBJECTS_DIR = "objects"
+
+    def __init__(self, root: str = "page_archive"):
+        self.root = Path(root)
+        self.objects_dir = self.root / self.OBJECTS_DIR
+        self.index_file = self.root / self.INDEX_FILE
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._latest: Dict[str, dict] = {}
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Load the URL index, keeping the latest entry per URL"""
+        if not self.index_file.exists():
+            return
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a partial last line; skip it
+                    continue
+                self._latest[canonical_url(entry["url"])] = entry
+
+    def object_path(self, digest: str) -> Path:
+        """Return the on-disk path of a stored page"""
+        return self.objects_dir / digest[:2] / f"{digest}.html.gz"
+
+    def store(self, url: str, html: str) -> str:
+        """Store a fetched page and point the URL at it. Returns the digest."""
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+
+        path = self.object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(data, mtime=0))
+            os.replace(tmp_path, path)
+
+        key = canonical_url(url)
+        current = self._latest.get(key)
+        if current is None or current["sha256"] != digest:
+            entry = {
+                "url": url,
+                "sha256": digest,
+                "fetched_at": datetime.now().isoformat(timespec='seconds')
+            }
+            with open(self.index_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+            self._latest[key] = entry
+
+        return digest
+
+    def latest(self, url: str) -> Optional[str]:
+        """Return the digest of the latest fetch of a URL, if any"""
+        entry = self._latest.get(canonical_url(url))
+        return entry["sha256"] if entry else None
+
+    def read(self, digest: str) -> str:
+        """Return the HTML stored under a digest"""
+        return self.read_object(self.object_path(digest))
+
+    @staticmethod
+    def read_object(path) -> str:
+        """Decompress a stored page file"""
+        with open(path, 'rb') as f:
+            return gzip.decompress(f.read()).decode('utf-8')
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the latest archived HTML for a URL, if any"""
+        digest = self.latest(url)
+        return self.read(digest) if digest else None
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Yield (url, digest) pairs for the latest version of every page"""
+        for entry in self._latest.values():
+            yield entry["url"], entry["sha256"]
+
+    def __contains__(self, url: str) -> bool:
+        return canonical_url(url) in self._latest
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+
+class ProfilePageParser(HTMLParser):
+    """
+    Pull the name and headline text out of saved profile HTML.
+
+    Matches the same elements the live scraper reads with CSS selectors,
+    so archived pages can be re-extracted without a browser.
+    """
+
+    TARGETS = {
+        'name': ('h1', {'text-heading-xlarge', 'inline', 't-24'}),
+        'headline': ('div', {'text-body-medium', 'break-words'}),
+    }
+    # Elements that only need to be present; the live scraper waits for these
+    MARKERS = {
+        'profile_section': ('div', {'mt2', 'relative'}),
+    }
+    # Elements that start a new line in rendered text, as in Selenium's .text
+    BREAK_TAGS = {'br', 'div', 'p', 'li', 'ul', 'ol', 'section', 'header',
+                  'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr', 'table'}
+
+    def __init__(self):
+        super().__init__()
+        self.results = {}
+        self._current = None
+        self._tag = None
+        self._depth = 0
+        self._chunks = []
+
+    def handle_starttag(self, tag, attrs):
+        classes = set((dict(attrs).get('class') or '').split())
+        for key, (marker_tag, marker_classes) in self.MARKERS.items():
+            if tag == marker_tag and marker_classes <= classes:
+                self.results[key] = True
+
+        if self._current:
+            if tag in self.BREAK_TAGS:
+                self._chunks.append(' ')
+            if tag == self._tag:
+                self._depth += 1
+            return
+
+        for key, (target_tag, target_classes) in self.TARGETS.items():
+            if key not in self.results and tag == target_tag and target_classes <= classes:
+                self._current = key
+                self._tag = tag
+                self._depth = 1
+                self._chunks = []
+                return
+
+    def handle_endtag(self, tag):
+        if not self._current:
+            return
+        if tag in self.BREAK_TAGS:
+            self._chunks.append(' ')
+        if tag != self._tag:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            self.results[self._current] = ' '.join(''.join(self._chunks).split())
+            self._current = None
+
+    def handle_data(self, data):
+        if self._current:
+            self._chunks.append(data)
+
+    @classmethod
+    def parse(cls, html: str) -> dict:
+        """Return a dict with 'name', 'headline' and marker keys where found"""
+        parser = cls()
+        parser.feed(html)
+        parser.close()
+        return parser.results
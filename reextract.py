@@ -0,0 +1,120 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from linkedin_validator import LinkedInValidator
+from page_archive import PageArchive, canonical_url
+
+
+def _extract_snapshot(task):
+    """
+    Re-extract a single archived page. Runs inside a worker process.
+
+    Returns a plain tuple instead of a dict or DataFrame so results are
+    cheap to pickle back to the parent.
+    """
+    url_key, path = task
+    try:
+        info = LinkedInValidator.extract_profile_from_html(PageArchive.read_object(path), url_key)
+    except Exception:
+        info = None
+    if not info:
+        return url_key, None
+    return url_key, (info['first_name'], info['last_name'], info['job_title'], info['company_name'])
+
+
+def reextract_archive(roster_file, archive_dir="page_archive", workers=None, chunksize=None):
+    """
+    Re-run name and headline extraction over every archived snapshot of
+    the roster's profiles and return the resulting updates list.
+    Raises ValueError if the roster cannot be read or is missing columns.
+    """
+    _, roster, error = LinkedInValidator.read_roster_file(roster_file)
+    if error:
+        raise ValueError(error)
+    profiles = LinkedInValidator.profiles_from_frame(roster)
+    archive = PageArchive(archive_dir)
+
+    # Each archived page is re-extracted once, however many spellings of
+    # its URL the roster uses
+    snapshots = {}
+    for profile in profiles:
+        key = canonical_url(profile['linkedin_url'])
+        if key not in snapshots and profile['linkedin_url'] in archive:
+            snapshots[key] = str(archive.object_path(archive.latest(profile['linkedin_url'])))
+    tasks = list(snapshots.items())
+    if not tasks:
+        print("No archived snapshots found for this roster.")
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    # Large chunks keep per-task IPC overhead low; several chunks per
+    # worker keep the pool balanced when some pages parse slower.
+    chunksize = chunksize or max(1, len(tasks) // (workers * 4))
+
+    results = {}
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for url_key, fields in executor.map(_extract_snapshot, tasks, chunksize=chunksize):
+            if fields is None:
+                failed += 1
+            else:
+                results[url_key] = fields
+
+    update_date = datetime.now().strftime('%Y-%m-%d')
+    updates_list = []
+    for profile in profiles:
+        fields = results.get(canonical_url(profile['linkedin_url']))
+        if fields is None:
+            continue
+        first_name, last_name, job_title, company_name = fields
+        current_info = {
+            'first_name': first_name,
+            'last_name': last_name,
+            'job_title': job_title,
+            'company_name': company_name,
+            'linkedin_url': profile['linkedin_url']
+        }
+        if LinkedInValidator.has_changed(profile, current_info):
+            updates_list.append({
+                'original': profile,
+                'current': current_info,
+                'update_date': update_date
+            })
+
+    print(f"Re-extracted {len(results)} snapshots ({failed} failed) with {workers} workers")
+    return updates_list
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-extract profile data from archived pages and report changes"
+    )
+    parser.add_argument("roster", help="Roster CSV file")
+    parser.add_argument("--archive", default="page_archive", help="Page archive directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunksize", type=int, default=None, help="Snapshots per worker task")
+    args = parser.parse_args()
+
+    start = time.time()
+    try:
+        updates_list = reextract_archive(args.roster, args.archive, args.workers, args.chunksize)
+    except ValueError as e:
+        sys.exit(f"Invalid roster {args.roster}: {str(e)}")
+    elapsed = time.time() - start
+
+    if not updates_list:
+        print("No updates found to save.")
+        return
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_file = f'linkedin_reextract_{timestamp}.csv'
+    LinkedInValidator.build_updates_frame(updates_list).to_csv(output_file, index=False)
+    print(f"Saved {len(updates_list)} updates to {output_file} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
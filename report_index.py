@@ -0,0 +1,61 @@
+import hashlib
+import os
+from array import array
+
+
+class ReportedChangeIndex:
+    """
+    Persisted set of changes already written to an updates report.
+
+    Each change (canonical URL, new company, new title) is stored as a
+    64-bit BLAKE2b digest in an append-only binary file. The whole index
+    is held in memory as a set of ints, so lookups stay constant-time
+    even with millions of entries.
+    """
+
+    def __init__(self, path="reported_changes.idx"):
+        self.path = path
+        self._keys = set()
+        self._pending = array('Q')
+        self._load()
+
+    def _load(self):
+        """Load all stored digests"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        # Ignore a partial trailing entry left by an interrupted write
+        usable = len(data) - len(data) % self._pending.itemsize
+        keys = array('Q')
+        keys.frombytes(data[:usable])
+        self._keys = set(keys)
+
+    @staticmethod
+    def make_key(url_key, company, title):
+        """Digest of one reported change"""
+        text = "\x1f".join([url_key, company.strip().lower(), title.strip().lower()])
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little')
+
+    def add(self, key):
+        """Record a change as reported. Call flush() to persist."""
+        if key not in self._keys:
+            self._keys.add(key)
+            self._pending.append(key)
+
+    def flush(self):
+        """Append newly added digests to the index file"""
+        if not self._pending:
+            return
+        with open(self.path, 'ab') as f:
+            f.write(self._pending.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending = array('Q')
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __len__(self):
+        return len(self._keys)
@@ -0,0 +1,137 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StatusPublisher:
+    """
+    Read-only progress status for long verification runs.
+
+    The status is served as JSON on a localhost HTTP endpoint and/or
+    written atomically to a status file. All the work happens on
+    background threads: the verification loop only bumps counters, and
+    snapshot_fn is called here whenever a status is built.
+    """
+
+    RATE_WINDOW = 300  # seconds of history used for the current rate
+
+    def __init__(self, snapshot_fn, port=None, status_file=None, interval=5):
+        self.snapshot_fn = snapshot_fn
+        self.port = port
+        self.status_file = status_file
+        self.interval = interval
+        self.started_at = None
+        self._samples = deque()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._server = None
+        self._threads = []
+
+    def start(self):
+        """Start the HTTP endpoint and/or the status file writer"""
+        self.started_at = time.time()
+        self._stop_event.clear()
+
+        if self.port:
+            try:
+                self._server = ThreadingHTTPServer(('127.0.0.1', self.port), self._make_handler())
+            except OSError as e:
+                # Monitoring is optional; never let it stop a run
+                print(f"Could not start status endpoint on port {self.port}: {str(e)}")
+                self._server = None
+            if self._server:
+                self._server.daemon_threads = True
+                self._spawn(self._server.serve_forever)
+                print(f"Status available at http://127.0.0.1:{self.port}/status")
+
+        if self.status_file:
+            self._spawn(self._write_loop)
+            print(f"Status written to {self.status_file}")
+
+    def stop(self):
+        """Stop publishing and write a final status"""
+        self._stop_event.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=self.interval)
+        self._threads = []
+        if self.status_file:
+            self._write_status_file()
+
+    def _spawn(self, target):
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def build_status(self):
+        """Build the current status, adding rate and ETA to the snapshot"""
+        status = self.snapshot_fn()
+        now = time.time()
+        processed = status.get('processed', 0)
+        remaining = status.get('remaining', 0)
+
+        with self._lock:
+            self._samples.append((now, processed))
+            while len(self._samples) > 2 and now - self._samples[0][0] > self.RATE_WINDOW:
+                self._samples.popleft()
+            first_time, first_processed = self._samples[0]
+
+        if now - first_time > 0 and processed > first_processed:
+            rate = (processed - first_processed) / (now - first_time)
+        elif now - self.started_at > 0:
+            rate = processed / (now - self.started_at)
+        else:
+            rate = 0
+
+        eta_seconds = remaining / rate if rate > 0 else None
+        status.update({
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'elapsed_seconds': round(now - self.started_at),
+            'rate_per_minute': round(rate * 60, 2),
+            'eta_seconds': round(eta_seconds) if eta_seconds is not None else None,
+            'eta': (datetime.now() + timedelta(seconds=eta_seconds)).isoformat(timespec='seconds')
+                   if eta_seconds is not None else None
+        })
+        return status
+
+    def _write_loop(self):
+        while not self._stop_event.wait(self.interval):
+            self._write_status_file()
+
+    def _write_status_file(self):
+        """Replace the status file atomically so readers never see partial JSON"""
+        try:
+            tmp_file = f"{self.status_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(self.build_status(), f, indent=2)
+            os.replace(tmp_file, self.status_file)
+        except Exception as e:
+            print(f"Error writing status file: {str(e)}")
+
+    def _make_handler(self):
+        publisher = self
+
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') not in ('', '/status'):
+                    self.send_error(404)
+                    return
+                body = json.dumps(publisher.build_status(), indent=2).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep request logs out of the console output
+                pass
+
+        return StatusHandler
@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'optional'))
+
+from controller import ScrapingController, SessionPlanner
+
+
+@pytest.mark.parametrize("seconds_per_item", [0, 20, 60])
+def test_plan_has_no_pause_after_final_batch(seconds_per_item):
+    planner = SessionPlanner(seed=1, seconds_per_item=seconds_per_item)
+    for _ in range(300):
+        plan = planner.plan()
+        assert len(plan.pause_seconds) == len(plan.batch_sizes) - 1
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_controller_walks_whole_plan(tmp_path, seed):
+    # Zero-length pauses let the walk run without waiting
+    controller = ScrapingController(
+        state_file=str(tmp_path / "state.json"),
+        sleep_range=(0, 0),
+        seed=seed,
+        seconds_per_item=60
+    )
+    session = controller.start_session()
+    planned = session["plan"]["batch_sizes"]
+
+    scraped = []
+    while True:
+        action = controller.get_next_action()
+        if action["action"] == "stop":
+            break
+        assert action["action"] in ("continue", "scrape")
+        scraped.append(action["items"])
+        controller.pause_scraping()
+
+    assert scraped == planned
+    assert not controller.should_continue()
+
+
+def _run_session(controller):
+    controller.start_session()
+    sizes = controller.plan.batch_sizes
+    controller.stop_session()
+    return sizes
+
+
+def test_seeded_sessions_continue_across_processes(tmp_path):
+    single = ScrapingController(state_file=str(tmp_path / "single.json"), seed=42)
+    expected = [_run_session(single) for _ in range(3)]
+
+    state_file = str(tmp_path / "restarted.json")
+    restarted = [
+        _run_session(ScrapingController(state_file=state_file, seed=42))
+        for _ in range(3)
+    ]
+
+    assert restarted == expected
+    assert expected[0] != expected[1]
+
+
+def test_state_without_session_seed_is_not_resumed(tmp_path):
+    # Mid-session state written by a controller that did not store plans
+    state_file = tmp_path / "state.json"
+    state_file.write_text(json.dumps({
+        "state": "running",
+        "next_run_time": None,
+        "items_to_scrape": 15,
+        "current_session_end": (datetime.now() + timedelta(hours=8)).isoformat()
+    }))
+
+    controller = ScrapingController(state_file=str(state_file), seed=1)
+    assert not controller.should_continue()
+    assert controller.get_next_action()["action"] == "stop"
+
+    session = controller.start_session()
+    assert controller.get_next_action()["items"] == session["plan"]["batch_sizes"][0]
+    controller.pause_scraping()
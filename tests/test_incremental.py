@@ -0,0 +1,78 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from linkedin_validator import LinkedInValidator
+
+
+def _validator(fingerprint_file, rows, recheck_after_days=30):
+    # Skip __init__, which opens a Tk window
+    validator = LinkedInValidator.__new__(LinkedInValidator)
+    validator.fingerprint_file = str(fingerprint_file)
+    validator.recheck_after_days = recheck_after_days
+    validator._fingerprints = None
+    validator._verified_keys = set()
+    validator.df = pd.DataFrame(rows, columns=LinkedInValidator.REQUIRED_COLUMNS)
+    return validator
+
+
+def _run(fingerprint_file, rows, verify=True):
+    """Classify rows, mark every row as verified and save fingerprints"""
+    validator = _validator(fingerprint_file, rows)
+    validator._classify_rows()
+    if verify:
+        validator._verified_keys = set(validator._fingerprints['URL Key'])
+    validator._save_fingerprints()
+    return validator.df
+
+
+ROW = ['Acme', 'John', 'Doe', 'Engineer', 'https://www.linkedin.com/in/john/']
+
+
+def test_first_run_marks_rows_new(tmp_path):
+    df = _run(tmp_path / "fp.csv", [ROW])
+    assert list(df['Row Status']) == ['new']
+    assert list(df['Verify']) == [True]
+
+
+def test_unchanged_rows_are_not_due(tmp_path):
+    _run(tmp_path / "fp.csv", [ROW])
+    df = _run(tmp_path / "fp.csv", [ROW])
+    assert list(df['Row Status']) == ['unchanged']
+    assert list(df['Verify']) == [False]
+
+
+def test_edited_row_is_due(tmp_path):
+    _run(tmp_path / "fp.csv", [ROW])
+    df = _run(tmp_path / "fp.csv", [['Globex'] + ROW[1:]])
+    assert list(df['Row Status']) == ['edited']
+    assert list(df['Verify']) == [True]
+
+
+def test_url_on_several_rows_stays_unchanged(tmp_path):
+    # Two rosters disagree about the same person
+    rows = [ROW, ['Globex'] + ROW[1:-1] + ['https://linkedin.com/in/john']]
+    _run(tmp_path / "fp.csv", rows)
+    df = _run(tmp_path / "fp.csv", rows)
+    assert list(df['Row Status']) == ['unchanged', 'unchanged']
+    assert not df['Verify'].any()
+
+
+def test_unverified_rows_stay_due(tmp_path):
+    _run(tmp_path / "fp.csv", [ROW], verify=False)
+    df = _run(tmp_path / "fp.csv", [ROW])
+    assert list(df['Row Status']) == ['unchanged']
+    assert list(df['Verify']) == [True]
+
+
+@pytest.mark.parametrize("recheck_after_days", [None, 0])
+def test_recheck_window(tmp_path, recheck_after_days):
+    _run(tmp_path / "fp.csv", [ROW])
+    validator = _validator(tmp_path / "fp.csv", [ROW], recheck_after_days)
+    validator._classify_rows()
+    # None re-checks every row; 0 days makes today's verification stale only after today
+    assert list(validator.df['Verify']) == [recheck_after_days is None]
@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from page_archive import PageArchive, ProfilePageParser
+
+
+def test_any_spelling_of_a_url_finds_its_page(tmp_path):
+    archive = PageArchive(str(tmp_path / "archive"))
+    archive.store("https://www.linkedin.com/in/John/", "<html>john</html>")
+
+    for spelling in ["https://linkedin.com/in/john", "http://www.linkedin.com/in/john/"]:
+        assert spelling in archive
+        assert archive.get(spelling) == "<html>john</html>"
+
+    reloaded = PageArchive(str(tmp_path / "archive"))
+    assert reloaded.get("https://linkedin.com/in/john") == "<html>john</html>"
+    assert len(reloaded) == 1
+
+
+def test_refetch_under_another_spelling_replaces_the_page(tmp_path):
+    archive = PageArchive(str(tmp_path / "archive"))
+    archive.store("https://www.linkedin.com/in/john/", "<html>old</html>")
+    archive.store("https://linkedin.com/in/john", "<html>new</html>")
+    assert archive.get("https://www.linkedin.com/in/john/") == "<html>new</html>"
+    assert len(archive) == 1
+
+
+def test_parser_separates_text_at_line_breaks():
+    html = (
+        '<h1 class="text-heading-xlarge inline t-24">John<br>Doe</h1>'
+        '<div class="text-body-medium break-words"><div>Engx</div>at <span>Y</span>Corp</div>'
+    )
+    fields = ProfilePageParser.parse(html)
+    assert fields['name'] == 'John Doe'
+    # Inline elements do not break words
+    assert fields['headline'] == 'Engx at YCorp'
@@ -0,0 +1,215 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+# Common abbreviations expanded before titles are compared
+ABBREVIATIONS = {
+    'sr': 'senior',
+    'snr': 'senior',
+    'jr': 'junior',
+    'jnr': 'junior',
+    'assoc': 'associate',
+    'asst': 'assistant',
+    'mgr': 'manager',
+    'mngr': 'manager',
+    'dir': 'director',
+    'eng': 'engineer',
+    'engr': 'engineer',
+    'dev': 'developer',
+    'swe': 'software engineer',
+    'sde': 'software development engineer',
+    'pm': 'product manager',
+    'vp': 'vice president',
+    'svp': 'senior vice president',
+    'evp': 'executive vice president',
+    'avp': 'assistant vice president',
+    'ceo': 'chief executive officer',
+    'cto': 'chief technology officer',
+    'cfo': 'chief financial officer',
+    'coo': 'chief operating officer',
+    'cio': 'chief information officer',
+    'cmo': 'chief marketing officer',
+    'exec': 'executive',
+    'admin': 'administrator',
+    'acct': 'accountant',
+    'mktg': 'marketing',
+    'ops': 'operations',
+    'hr': 'human resources',
+    'cofounder': 'co founder',
+}
+
+# Seniority ranks; titles without any of these are ranked as individual contributors
+SENIORITY_RANKS = {
+    'intern': 0,
+    'trainee': 0,
+    'junior': 1,
+    'assistant': 1,
+    'associate': 1,
+    'senior': 3,
+    'lead': 4,
+    'staff': 4,
+    'principal': 5,
+    'manager': 5,
+    'head': 6,
+    'director': 6,
+    'assistant vice president': 7,
+    'vice president': 8,
+    'senior vice president': 9,
+    'executive vice president': 9,
+    'president': 10,
+    'partner': 10,
+    'chief': 10,
+    'founder': 10,
+}
+DEFAULT_SENIORITY = 2
+# "Senior" on top of a higher-ranked role word (e.g. "senior product manager") adds one rank
+SENIOR_MODIFIER = 'senior'
+
+# Keywords mapping a title to its function, checked in the order they appear in the title
+FUNCTION_KEYWORDS = {
+    'engineer': 'engineering',
+    'engineering': 'engineering',
+    'developer': 'engineering',
+    'software': 'engineering',
+    'devops': 'engineering',
+    'architect': 'engineering',
+    'technology': 'engineering',
+    'data': 'data',
+    'analyst': 'data',
+    'analytics': 'data',
+    'scientist': 'data',
+    'product': 'product',
+    'design': 'design',
+    'designer': 'design',
+    'ux': 'design',
+    'sales': 'sales',
+    'account executive': 'sales',
+    'business development': 'sales',
+    'marketing': 'marketing',
+    'finance': 'finance',
+    'financial': 'finance',
+    'accountant': 'finance',
+    'accounting': 'finance',
+    'operations': 'operations',
+    'operating': 'operations',
+    'human resources': 'people',
+    'recruiter': 'people',
+    'talent': 'people',
+    'people': 'people',
+    'counsel': 'legal',
+    'legal': 'legal',
+    'attorney': 'legal',
+    'support': 'support',
+    'customer success': 'support',
+    'research': 'research',
+    'researcher': 'research',
+    'executive officer': 'executive',
+    'founder': 'executive',
+}
+DEFAULT_FUNCTION = 'other'
+
+COMPANY_SUFFIXES = ['inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation',
+                    'co', 'company', 'gmbh', 'plc', 'ag', 'sa', 'bv', 'pvt']
+
+CHANGE_COSMETIC = 'cosmetic'
+CHANGE_PROMOTION = 'promotion'
+CHANGE_ROLE = 'role change'
+CHANGE_COMPANY = 'company move'
+
+
+def _phrase_pattern(phrases):
+    """Compile a whole-word alternation that prefers the longest phrase"""
+    ordered = sorted(phrases, key=len, reverse=True)
+    return re.compile(r'\b(' + '|'.join(re.escape(p) for p in ordered) + r')\b')
+
+
+_ABBREVIATION_PATTERN = _phrase_pattern(ABBREVIATIONS)
+_SENIORITY_PATTERN = _phrase_pattern(SENIORITY_RANKS)
+_FUNCTION_PATTERN = _phrase_pattern(FUNCTION_KEYWORDS)
+_COMPANY_SUFFIX_PATTERN = _phrase_pattern(COMPANY_SUFFIXES)
+
+
+def _clean(values):
+    """Lowercase and replace punctuation with spaces"""
+    return values.fillna('').astype(str).str.lower().str.replace(r'[^a-z0-9&]+', ' ', regex=True)
+
+
+def _squash(values):
+    """Collapse runs of whitespace"""
+    return values.str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def _seniority(title):
+    matches = _SENIORITY_PATTERN.findall(title)
+    if not matches:
+        return DEFAULT_SENIORITY
+    rank = max(SENIORITY_RANKS[m] for m in matches)
+    if SENIOR_MODIFIER in matches and rank > SENIORITY_RANKS[SENIOR_MODIFIER]:
+        rank += 1
+    return rank
+
+
+def _function(title):
+    match = _FUNCTION_PATTERN.search(title)
+    return FUNCTION_KEYWORDS[match.group(1)] if match else DEFAULT_FUNCTION
+
+
+def build_title_table(titles):
+    """
+    Build a lookup table for the distinct titles in a Series.
+    Indexed by raw title with normalized, seniority and function columns.
+    """
+    unique = pd.Series(pd.unique(titles.fillna('').astype(str)))
+    normalized = _squash(
+        _clean(unique).str.replace(
+            _ABBREVIATION_PATTERN, lambda m: ABBREVIATIONS[m.group(1)], regex=True
+        )
+    )
+    return pd.DataFrame({
+        'normalized': normalized.to_numpy(),
+        'seniority': normalized.map(_seniority).to_numpy(),
+        'function': normalized.map(_function).to_numpy(),
+    }, index=unique.to_numpy())
+
+
+def normalize_companies(companies):
+    """Normalize company names, dropping punctuation and legal suffixes"""
+    unique = pd.Series(pd.unique(companies.fillna('').astype(str)))
+    normalized = _squash(_clean(unique).str.replace(_COMPANY_SUFFIX_PATTERN, ' ', regex=True))
+    lookup = pd.Series(normalized.to_numpy(), index=unique.to_numpy())
+    return companies.fillna('').astype(str).map(lookup)
+
+
+def classify_changes(frame):
+    """
+    Classify each row of an updates report as a cosmetic change,
+    promotion, role change or company move. Returns a Series aligned
+    with the frame.
+    """
+    if frame.empty:
+        return pd.Series([], index=frame.index, dtype=object)
+
+    table = build_title_table(pd.concat([frame['Original Job Title'], frame['New Job Title']]))
+    old_title = table.reindex(frame['Original Job Title'].fillna('').astype(str).to_numpy())
+    new_title = table.reindex(frame['New Job Title'].fillna('').astype(str).to_numpy())
+
+    old_company = normalize_companies(frame['Original Company']).to_numpy()
+    new_company = normalize_companies(frame['New Company']).to_numpy()
+
+    company_move = (old_company != new_company) & (new_company != '')
+    cosmetic = old_title['normalized'].to_numpy() == new_title['normalized'].to_numpy()
+    promotion = (
+        (old_title['function'].to_numpy() == new_title['function'].to_numpy()) &
+        (new_title['seniority'].to_numpy() > old_title['seniority'].to_numpy())
+    )
+
+    return pd.Series(
+        np.select(
+            [company_move, cosmetic, promotion],
+            [CHANGE_COMPANY, CHANGE_COSMETIC, CHANGE_PROMOTION],
+            default=CHANGE_ROLE
+        ),
+        index=frame.index
+    )